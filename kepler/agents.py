@@ -9,6 +9,7 @@ Agents:
 4. Jury Foreman - Synthesizes verdict
 """
 
+import httpx
 from openai import OpenAI
 from dataclasses import dataclass
 from enum import Enum
@@ -59,9 +60,24 @@ class DebateResult:
     all_epistemologist_responses: list[dict] = None
     # Forced binary verdict tracking
     initial_verdict: Verdict = None
+    initial_verdict_response: dict = None
     forced_binary_used: bool = False
 
 
+@dataclass
+class DebateState:
+    """Outcome of the prosecutor/defense/epistemologist rounds, before any verdict."""
+    claim: str
+    truth: str
+    prosecution: dict
+    defense: dict
+    epistemology: dict
+    debate_transcript: list[dict]
+    all_prosecutor_responses: list[dict]
+    all_defense_responses: list[dict]
+    all_epistemologist_responses: list[dict]
+
+
 # =============================================================================
 # AGENT SYSTEM PROMPTS
 # =============================================================================
@@ -198,10 +214,17 @@ Be decisive but calibrated. Acknowledge uncertainty without being paralyzed by i
 # =============================================================================
 
 class DebateOrchestrator:
-    def __init__(self, api_key: str, dev_mode: bool = True):
-        self.client = OpenAI(api_key=api_key)
+    def __init__(self, api_key: str, dev_mode: bool = True, http_client: Optional[httpx.Client] = None,
+                 verbose: bool = True):
+        self.client = OpenAI(api_key=api_key, http_client=http_client)
         self.model = "gpt-4.1-mini" if dev_mode else "gpt-4.1"
         self.debate_history = []
+        # Print the tribunal progress log; turn off when running debates concurrently
+        self.verbose = verbose
+
+    def _log(self, *args):
+        if self.verbose:
+            print(*args)
 
     def _call_agent(self, system_prompt: str, user_prompt: str, agent_name: str) -> dict:
         """Call an agent and parse JSON response."""
@@ -365,8 +388,15 @@ IMPORTANT: Your verdict MUST be either "faithful" or "mutated" - NOT "ambiguous"
             num_rounds: Number of debate rounds (random 2-4 if not specified)
             force_binary_if_ambiguous: If True, force a binary verdict when initial verdict is ambiguous
         """
-        import random
-        
+        state = self.run_debate_rounds(claim, truth, num_rounds)
+        return self.finalize_verdict(state, force_binary_if_ambiguous)
+
+    def run_debate_rounds(self, claim: str, truth: str, num_rounds: int = None) -> DebateState:
+        """Run the prosecutor/defense/epistemologist rounds without reaching a verdict.
+
+        The returned state can be passed to `finalize_verdict` any number of
+        times, e.g. once with and once without forcing a binary verdict.
+        """
         self.debate_history = []
         
         # Random number of debate rounds (2-4) if not specified
@@ -378,49 +408,86 @@ IMPORTANT: Your verdict MUST be either "faithful" or "mutated" - NOT "ambiguous"
         all_defense_responses = []
         all_epistemologist_responses = []
 
-        print(f"\n{'='*60}")
-        print("TRIBUNAL COMMENCING")
-        print(f"{'='*60}")
-        print(f"\nCLAIM: {claim[:100]}...")
-        print(f"TRUTH: {truth[:100]}...")
-        print(f"\n🔄 {num_rounds} rounds of debate will occur\n")
+        self._log(f"\n{'='*60}")
+        self._log("TRIBUNAL COMMENCING")
+        self._log(f"{'='*60}")
+        self._log(f"\nCLAIM: {claim[:100]}...")
+        self._log(f"TRUTH: {truth[:100]}...")
+        self._log(f"\n🔄 {num_rounds} rounds of debate will occur\n")
 
         # Round 1: Initial positions
-        print(f"[Round 1] Prosecutor presenting initial accusations...")
+        self._log(f"[Round 1] Prosecutor presenting initial accusations...")
         prosecution = self.run_prosecution(claim, truth)
         all_prosecutor_responses.append(prosecution)
 
-        print(f"[Round 1] Defense presenting initial rebuttals...")
+        self._log(f"[Round 1] Defense presenting initial rebuttals...")
         defense = self.run_defense(claim, truth, prosecution)
         all_defense_responses.append(defense)
 
-        print(f"[Round 1] Epistemologist analyzing uncertainty...")
+        self._log(f"[Round 1] Epistemologist analyzing uncertainty...")
         epistemology = self.run_epistemologist(claim, truth, prosecution, defense)
         all_epistemologist_responses.append(epistemology)
 
         # Additional debate rounds (agents respond to each other)
         for round_num in range(2, num_rounds + 1):
-            print(f"\n[Round {round_num}] Continuing debate...")
+            self._log(f"\n[Round {round_num}] Continuing debate...")
             
             # Prosecutor responds to defense
-            print(f"[Round {round_num}] Prosecutor counter-response...")
+            self._log(f"[Round {round_num}] Prosecutor counter-response...")
             prosecution = self._prosecutor_counter_response(claim, truth, prosecution, defense, epistemology)
             all_prosecutor_responses.append(prosecution)
             
             # Defense responds to prosecutor
-            print(f"[Round {round_num}] Defense counter-response...")
+            self._log(f"[Round {round_num}] Defense counter-response...")
             defense = self._defense_counter_response(claim, truth, prosecution, defense, epistemology)
             all_defense_responses.append(defense)
             
             # Epistemologist updates analysis
-            print(f"[Round {round_num}] Epistemologist updating analysis...")
+            self._log(f"[Round {round_num}] Epistemologist updating analysis...")
             epistemology = self.run_epistemologist(claim, truth, prosecution, defense)
             all_epistemologist_responses.append(epistemology)
 
+        return DebateState(
+            claim=claim,
+            truth=truth,
+            prosecution=prosecution,
+            defense=defense,
+            epistemology=epistemology,
+            debate_transcript=list(self.debate_history),
+            all_prosecutor_responses=all_prosecutor_responses,
+            all_defense_responses=all_defense_responses,
+            all_epistemologist_responses=all_epistemologist_responses
+        )
+
+    def finalize_verdict(self, state: DebateState, force_binary_if_ambiguous: bool = False) -> DebateResult:
+        """Final round: Jury Foreman delivers a verdict on a completed debate."""
+        claim, truth = state.claim, state.truth
+        prosecution, defense, epistemology = state.prosecution, state.defense, state.epistemology
+
+        # Continue the transcript from the end of the debate rounds
+        self.debate_history = list(state.debate_transcript)
+
         # Final Round: Jury Foreman delivers verdict
-        print(f"\n[Final Round] Jury Foreman deliberating...")
+        self._log(f"\n[Final Round] Jury Foreman deliberating...")
         verdict_response = self.run_jury_foreman(claim, truth, prosecution, defense, epistemology)
 
+        return self._conclude_verdict(state, verdict_response, force_binary_if_ambiguous)
+
+    def force_binary(self, state: DebateState, standard: DebateResult) -> DebateResult:
+        """Force a binary verdict on top of a standard (non-forced) result for the same debate.
+
+        Reuses the standard Jury Foreman response instead of deliberating again,
+        so only the forced-binary call is made, and only if it was ambiguous.
+        """
+        self.debate_history = list(standard.debate_transcript)
+        return self._conclude_verdict(state, standard.initial_verdict_response, force_binary_if_ambiguous=True)
+
+    def _conclude_verdict(self, state: DebateState, verdict_response: dict,
+                          force_binary_if_ambiguous: bool) -> DebateResult:
+        """Parse the jury response, optionally force a binary verdict, and build the result."""
+        claim, truth = state.claim, state.truth
+        prosecution, defense, epistemology = state.prosecution, state.defense, state.epistemology
+
         # Parse verdict
         verdict_str = verdict_response.get("verdict", "ambiguous").lower()
         if verdict_str == "faithful":
@@ -437,10 +504,10 @@ IMPORTANT: Your verdict MUST be either "faithful" or "mutated" - NOT "ambiguous"
 
         # Force binary decision if requested and verdict is ambiguous
         if force_binary_if_ambiguous and verdict == Verdict.AMBIGUOUS:
-            print(f"\n{'='*60}")
-            print("INITIAL VERDICT: AMBIGUOUS")
-            print(f"{'='*60}")
-            print("\n⚖️  FORCING BINARY DECISION...")
+            self._log(f"\n{'='*60}")
+            self._log("INITIAL VERDICT: AMBIGUOUS")
+            self._log(f"{'='*60}")
+            self._log("\n⚖️  FORCING BINARY DECISION...")
             
             verdict_response = self.run_forced_binary_verdict(
                 claim, truth, prosecution, defense, epistemology, initial_verdict_response
@@ -458,14 +525,14 @@ IMPORTANT: Your verdict MUST be either "faithful" or "mutated" - NOT "ambiguous"
             
             forced_binary_used = True
 
-        print(f"\n{'='*60}")
+        self._log(f"\n{'='*60}")
         if forced_binary_used:
-            print(f"FORCED BINARY VERDICT: {verdict.value.upper()}")
+            self._log(f"FORCED BINARY VERDICT: {verdict.value.upper()}")
         else:
-            print(f"VERDICT: {verdict.value.upper()}")
-        print(f"CONFIDENCE: {verdict_response.get('confidence', 0):.0%}")
-        print(f"{'='*60}")
-        print(f"\nSUMMARY: {verdict_response.get('summary', 'No summary provided')}")
+            self._log(f"VERDICT: {verdict.value.upper()}")
+        self._log(f"CONFIDENCE: {verdict_response.get('confidence', 0):.0%}")
+        self._log(f"{'='*60}")
+        self._log(f"\nSUMMARY: {verdict_response.get('summary', 'No summary provided')}")
 
         return DebateResult(
             claim=claim,
@@ -493,10 +560,11 @@ IMPORTANT: Your verdict MUST be either "faithful" or "mutated" - NOT "ambiguous"
             verdict_reasoning=verdict_response.get("summary", ""),
             confidence=verdict_response.get("confidence", 0),
             debate_transcript=self.debate_history,
-            all_prosecutor_responses=all_prosecutor_responses,
-            all_defense_responses=all_defense_responses,
-            all_epistemologist_responses=all_epistemologist_responses,
+            all_prosecutor_responses=state.all_prosecutor_responses,
+            all_defense_responses=state.all_defense_responses,
+            all_epistemologist_responses=state.all_epistemologist_responses,
             initial_verdict=initial_verdict,
+            initial_verdict_response=initial_verdict_response,
             forced_binary_used=forced_binary_used
         )
     
@@ -3,33 +3,219 @@ Export comparison data for v0 visualization
 Creates a comprehensive JSON file with both single-agent and multi-agent results
 """
 
-import json
-import csv
+import argparse
+import asyncio
+import io
 import os
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
+from typing import Iterator, Optional
+
+import httpx
+import orjson
+import pandas as pd
+from tqdm import tqdm
+from tqdm.asyncio import tqdm_asyncio
 from single_agent_baseline import SingleAgentVerifier
 from agents import DebateOrchestrator
 
+# Upper bound on cases in flight at once (keeps us under OpenAI rate limits). A
+# case holds its slot for the whole pipeline, so it has at most two requests
+# in flight (single-agent + debate) and cases finish in a steady stream.
+MAX_CONCURRENT_CASES = 8
+# Rows parsed per batch when streaming Kepler.csv
+KEPLER_BATCH_SIZE = 10_000
+
+# Canonical verdict strings, interned so verdict comparisons and Counter
+# lookups hit CPython's identity fast path
+FAITHFUL = sys.intern("faithful")
+MUTATED = sys.intern("mutated")
+AMBIGUOUS = sys.intern("ambiguous")
+VERDICTS = (FAITHFUL, MUTATED, AMBIGUOUS)
+
+BAR = "=" * 70
+
+
+@dataclass
+class SingleAgentRecord:
+    verdict: str
+    confidence: float
+    reasoning: str
+    mutation_types: list[str]
+    process_time: str
+    llm_calls: int
+
+
+@dataclass
+class AgentRoundsRecord:
+    all_rounds: list[dict]
+    # The final arguments/confidence are the last entry of all_rounds;
+    # final_round_idx points at it instead of duplicating it (None if no rounds)
+    final_round_idx: Optional[int]
+
+    @classmethod
+    def from_rounds(cls, rounds: list[dict]) -> "AgentRoundsRecord":
+        return cls(rounds, len(rounds) - 1 if rounds else None)
+
+
+@dataclass
+class MultiAgentStandardRecord:
+    verdict: str
+    confidence: float
+    reasoning: str
+    mutation_types: list[str]
+    process_time: str
+    llm_calls: int
+    agents: dict[str, AgentRoundsRecord]
+
+
+@dataclass
+class MultiAgentForcedRecord:
+    verdict: str
+    confidence: float
+    reasoning: str
+    mutation_types: list[str]
+    process_time: str
+    llm_calls: int
+    forced_binary_used: bool
+    initial_verdict: Optional[str]
+
+
+@dataclass
+class ComparisonRecord:
+    sa_vs_ma_standard: bool
+    sa_vs_ma_forced: bool
+    ma_standard_vs_forced: bool
+    forced_changed_verdict: bool
+
+
+@dataclass
+class CaseRecord:
+    case_id: int
+    claim: str
+    truth: str
+    single_agent: SingleAgentRecord
+    multi_agent_standard: MultiAgentStandardRecord
+    multi_agent_forced: MultiAgentForcedRecord
+    comparison: ComparisonRecord
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "CaseRecord":
+        """Rebuild a record from its exported JSON form."""
+        ma_standard = dict(d["multi_agent_standard"])
+        ma_standard["agents"] = {name: AgentRoundsRecord(**agent) for name, agent in ma_standard["agents"].items()}
+        return cls(
+            case_id=d["case_id"],
+            claim=d["claim"],
+            truth=d["truth"],
+            single_agent=SingleAgentRecord(**d["single_agent"]),
+            multi_agent_standard=MultiAgentStandardRecord(**ma_standard),
+            multi_agent_forced=MultiAgentForcedRecord(**d["multi_agent_forced"]),
+            comparison=ComparisonRecord(**d["comparison"])
+        )
+
+
+def _pct(x: float) -> float:
+    """Fraction -> percentage with one decimal, rounding half up.
+
+    Matches round(x * 100, 1) for inputs with at most 3 decimals (as LLM
+    confidences are); values just off a half-step may round the other way.
+    """
+    return int(x * 1000.0 + 0.5) / 10.0
+
+
+def _fmt_prosecutor_rounds(resps: Optional[list[dict]]) -> list[dict]:
+    """Format every prosecutor round for visualization."""
+    if not resps:
+        return []
+    rounds = []
+    for i, resp in enumerate(resps):
+        rounds.append({
+            "round": i + 1,
+            "arguments": [acc.get("explanation", "") for acc in resp.get("accusations", [])],
+            "confidence": _pct(resp.get("confidence", 0))
+        })
+    return rounds
+
+
+def _fmt_defense_rounds(resps: Optional[list[dict]]) -> list[dict]:
+    """Format every defense round for visualization."""
+    if not resps:
+        return []
+    rounds = []
+    for i, resp in enumerate(resps):
+        rounds.append({
+            "round": i + 1,
+            "arguments": [reb.get("counter_argument", "") for reb in resp.get("rebuttals", [])],
+            "confidence": _pct(resp.get("confidence", 0))
+        })
+    return rounds
+
+
+def _fmt_epistemologist_rounds(resps: Optional[list[dict]]) -> list[dict]:
+    """Format every epistemologist round for visualization."""
+    if not resps:
+        return []
+    rounds = []
+    for i, resp in enumerate(resps):
+        rounds.append({
+            "round": i + 1,
+            "key_uncertainty": resp.get("key_uncertainty", ""),
+            "verifiable_facts": resp.get("verifiable_facts", []),
+            "confidence": _pct(resp.get("recommended_confidence_range", [0.5, 0.5])[1])
+        })
+    return rounds
+
+
+def load_partial_cases(partial_path: Path, data: list[dict]) -> dict[int, CaseRecord]:
+    """Load cases finished by an earlier, interrupted run.
+
+    Only records whose claim and truth still match `data` are kept. A torn
+    trailing line from a crash mid-write is cut off the file, so the
+    resumed run appends its records on a fresh line.
+    """
+    done = {}
+    if not partial_path.exists():
+        return done
+    with open(partial_path, 'r+b') as f:
+        content = f.read()
+        f.truncate(content.rfind(b"\n") + 1)
+        for line in content.splitlines():
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            idx = record["case_id"]
+            if idx < len(data) and (data[idx]['claim'], data[idx]['truth']) == (record["claim"], record["truth"]):
+                done[idx] = CaseRecord.from_dict(record)
+    return done
+
+
+def iter_kepler(filepath: str = "Kepler.csv") -> Iterator[dict]:
+    """Lazily yield claim-truth pairs from Kepler.csv, parsing it in batches"""
+    with pd.read_csv(filepath, usecols=['claim', 'truth'], dtype=str, na_filter=False,
+                     chunksize=KEPLER_BATCH_SIZE) as reader:
+        for chunk in reader:
+            chunk = chunk[(chunk['claim'] != '') & (chunk['truth'] != '')]
+            # Ids are the CSV row positions, so skipped rows leave gaps
+            for idx, claim, truth in zip(chunk.index.tolist(), chunk['claim'].str.strip(), chunk['truth'].str.strip()):
+                yield {'id': idx, 'claim': claim, 'truth': truth}
+
 
 def load_kepler_data(filepath: str = "Kepler.csv", limit: int = None) -> list[dict]:
     """Load claim-truth pairs from Kepler.csv"""
-    data = []
-    with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for idx, row in enumerate(reader):
-            if row['claim'] and row['truth']:
-                data.append({
-                    'id': idx,
-                    'claim': row['claim'].strip(),
-                    'truth': row['truth'].strip()
-                })
-            if limit and len(data) >= limit:
-                break
-    return data
-
-
-def export_for_visualization(num_cases: int = 5):
-    """Export comparison data formatted for v0 visualization."""
+    return list(islice(iter_kepler(filepath), limit or None))
+
+
+async def export_for_visualization(num_cases: int = 5, batch: bool = False):
+    """Export comparison data formatted for v0 visualization.
+
+    With `batch=True` the single-agent pass goes through the OpenAI Batch API
+    (cheaper, but may take hours) while the multi-agent debates run as usual.
+    """
     
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
@@ -40,9 +226,27 @@ def export_for_visualization(num_cases: int = 5):
     data = load_kepler_data(limit=num_cases)
     print(f"📚 Loaded {len(data)} cases for comparison\n")
     
-    # Initialize both systems
-    single_agent = SingleAgentVerifier(api_key)
-    multi_agent = DebateOrchestrator(api_key)
+    # Every finished case is appended to a partial file, so a rerun after a
+    # crash only pays for the cases that were still missing
+    output_file = "visualization_data.json"
+    partial_path = Path(output_file).with_suffix(".partial.jsonl")
+    done = load_partial_cases(partial_path, data)
+    pending = [(idx, case) for idx, case in enumerate(data) if idx not in done]
+    if done:
+        print(f"♻️  Resuming: {len(done)} cases restored from {partial_path}, {len(pending)} to run\n")
+    
+    # One pooled HTTP/2 client shared by every agent, so concurrent debates
+    # reuse connections instead of each paying its own TCP/TLS handshake
+    http_client = httpx.Client(
+        http2=True,
+        timeout=60,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    )
+    
+    # Initialize the single-agent system; the orchestrator keeps per-debate
+    # history, so every debate running concurrently gets its own instance
+    single_agent = SingleAgentVerifier(api_key, http_client=http_client)
+    case_slots = asyncio.Semaphore(MAX_CONCURRENT_CASES)
     
     comparison_data = {
         "metadata": {
@@ -53,114 +257,175 @@ def export_for_visualization(num_cases: int = 5):
         "cases": []
     }
     
-    for idx, case in enumerate(data):
-        print(f"\n{'='*70}")
-        print(f"Processing Case {idx}: {case['claim'][:60]}...")
-        print(f"{'='*70}")
-        
-        # Run single-agent
-        print("  Running single-agent...")
-        sa_result = single_agent.verify_claim(case['claim'], case['truth'])
+    # Duplicate (claim, truth) pairs share one task per system, so repeats in
+    # the corpus cost no extra LLM calls even while the first is in flight
+    sa_cache: dict[tuple[str, str], asyncio.Task] = {}
+    ma_cache: dict[tuple[str, str], asyncio.Task] = {}
+    
+    async def run_multi_agent(claim: str, truth: str):
+        # Both multi-agent variants share the same debate rounds; only the
+        # jury verdict differs (standard allows ambiguous, forced does not).
+        # Quiet, since concurrent tribunal logs would interleave and break the progress bar.
+        multi_agent = DebateOrchestrator(api_key, http_client=http_client, verbose=False)
+        state = await asyncio.to_thread(multi_agent.run_debate_rounds, claim, truth)
+        standard = await asyncio.to_thread(multi_agent.finalize_verdict, state)
+        if standard.final_verdict.value != AMBIGUOUS:
+            # Forcing only kicks in for ambiguous verdicts, so it would be a no-op
+            return standard, standard
+        # Force from the standard jury response rather than deliberating again,
+        # so the forced record is a forcing of exactly this ambiguous verdict
+        forced = await asyncio.to_thread(multi_agent.force_binary, state, standard)
+        return standard, forced
+    
+    # One batch request per distinct pending pair, mapped back by (claim, truth);
+    # nothing is submitted when every case was restored from the partial file
+    pairs = list(dict.fromkeys((c['claim'], c['truth']) for _, c in pending)) if batch else []
+    if pairs:
+        async def run_batch() -> dict:
+            results = await asyncio.to_thread(
+                single_agent.verify_claims_batch, [{'claim': c, 'truth': t} for c, t in pairs])
+            return dict(zip(pairs, results))
         
-        # Run multi-agent (standard - allows ambiguous)
-        print("  Running multi-agent debate (standard)...")
-        ma_result_standard = multi_agent.run_full_debate(case['claim'], case['truth'])
+        batch_task = asyncio.create_task(run_batch())
+    
+    async def run_single_agent(claim: str, truth: str):
+        if pairs:
+            return (await batch_task)[(claim, truth)]
+        return await asyncio.to_thread(single_agent.verify_claim, claim, truth)
+    
+    async def process_case(idx: int, case: dict) -> CaseRecord:
+        """Run all three systems on one case and format it for visualization."""
+        key = (case['claim'], case['truth'])
+        async with case_slots:
+            # Run single-agent and multi-agent concurrently
+            if key not in sa_cache:
+                sa_cache[key] = asyncio.create_task(run_single_agent(*key))
+            if key not in ma_cache:
+                ma_cache[key] = asyncio.create_task(run_multi_agent(*key))
+            # Wait for both even if one fails, so no call outlives its case.
+            # Batched single-agent results arrive all at once; wait for them
+            # outside the slot so the remaining debates keep running meanwhile.
+            await asyncio.wait([ma_cache[key]] if pairs else [sa_cache[key], ma_cache[key]])
+        sa_result, ma_results = await asyncio.gather(sa_cache[key], ma_cache[key], return_exceptions=True)
+        for result in (sa_result, ma_results):
+            if isinstance(result, BaseException):
+                raise result
+        ma_result_standard, ma_result_forced = ma_results
         
-        # Run multi-agent (forced binary - no ambiguous allowed)
-        print("  Running multi-agent debate (forced binary)...")
-        ma_result_forced = multi_agent.run_full_debate(case['claim'], case['truth'], force_binary_if_ambiguous=True)
+        sa_v = sys.intern(sa_result.verdict.value)
+        ma_s_v = sys.intern(ma_result_standard.final_verdict.value)
+        ma_f_v = sys.intern(ma_result_forced.final_verdict.value)
+        forced_used = ma_result_forced.forced_binary_used
+        init_v = sys.intern(ma_result_forced.initial_verdict.value) if ma_result_forced.initial_verdict else None
+        prosecutor_rounds = _fmt_prosecutor_rounds(ma_result_standard.all_prosecutor_responses)
+        defense_rounds = _fmt_defense_rounds(ma_result_standard.all_defense_responses)
+        epistemologist_rounds = _fmt_epistemologist_rounds(ma_result_standard.all_epistemologist_responses)
         
         # Format for visualization
-        case_data = {
-            "case_id": idx,
-            "claim": case['claim'],
-            "truth": case['truth'],
-            "single_agent": {
-                "verdict": sa_result.verdict.value,
-                "confidence": round(sa_result.confidence * 100, 1),
-                "reasoning": sa_result.reasoning,
-                "mutation_types": sa_result.mutation_types,
-                "process_time": "~5s",
-                "llm_calls": 1
-            },
-            "multi_agent_standard": {
-                "verdict": ma_result_standard.final_verdict.value,
-                "confidence": round(ma_result_standard.confidence * 100, 1),
-                "reasoning": ma_result_standard.verdict_reasoning,
-                "mutation_types": ma_result_standard.prosecutor_response.mutation_types,
-                "process_time": "~30s",
-                "llm_calls": len(ma_result_standard.debate_transcript),
-                "agents": {
-                    "prosecutor": {
-                        "all_rounds": [
-                            {
-                                "round": i + 1,
-                                "arguments": [acc.get("explanation", "") for acc in resp.get("accusations", [])],
-                                "confidence": round(resp.get("confidence", 0) * 100, 1)
-                            }
-                            for i, resp in enumerate(ma_result_standard.all_prosecutor_responses or [])
-                        ],
-                        "final_arguments": ma_result_standard.prosecutor_response.arguments,
-                        "final_confidence": round(ma_result_standard.prosecutor_response.confidence * 100, 1)
-                    },
-                    "defense": {
-                        "all_rounds": [
-                            {
-                                "round": i + 1,
-                                "arguments": [reb.get("counter_argument", "") for reb in resp.get("rebuttals", [])],
-                                "confidence": round(resp.get("confidence", 0) * 100, 1)
-                            }
-                            for i, resp in enumerate(ma_result_standard.all_defense_responses or [])
-                        ],
-                        "final_arguments": ma_result_standard.defense_response.arguments,
-                        "final_confidence": round(ma_result_standard.defense_response.confidence * 100, 1)
-                    },
-                    "epistemologist": {
-                        "all_rounds": [
-                            {
-                                "round": i + 1,
-                                "key_uncertainty": resp.get("key_uncertainty", ""),
-                                "verifiable_facts": resp.get("verifiable_facts", []),
-                                "confidence": round(resp.get("recommended_confidence_range", [0, 0])[-1] * 100, 1)
-                            }
-                            for i, resp in enumerate(ma_result_standard.all_epistemologist_responses or [])
-                        ],
-                        "final_uncertainty": ma_result_standard.epistemologist_response.arguments[0] if ma_result_standard.epistemologist_response.arguments else "",
-                        "final_confidence": round(ma_result_standard.epistemologist_response.confidence * 100, 1)
-                    }
+        case_data = CaseRecord(
+            case_id=idx,
+            claim=case['claim'],
+            truth=case['truth'],
+            single_agent=SingleAgentRecord(
+                verdict=sa_v,
+                confidence=_pct(sa_result.confidence),
+                reasoning=sa_result.reasoning,
+                mutation_types=sa_result.mutation_types,
+                process_time="~5s",
+                llm_calls=1
+            ),
+            multi_agent_standard=MultiAgentStandardRecord(
+                verdict=ma_s_v,
+                confidence=_pct(ma_result_standard.confidence),
+                reasoning=ma_result_standard.verdict_reasoning,
+                mutation_types=ma_result_standard.prosecutor_response.mutation_types,
+                process_time="~30s",
+                llm_calls=len(ma_result_standard.debate_transcript),
+                agents={
+                    "prosecutor": AgentRoundsRecord.from_rounds(prosecutor_rounds),
+                    "defense": AgentRoundsRecord.from_rounds(defense_rounds),
+                    "epistemologist": AgentRoundsRecord.from_rounds(epistemologist_rounds)
                 }
-            },
-            "multi_agent_forced": {
-                "verdict": ma_result_forced.final_verdict.value,
-                "confidence": round(ma_result_forced.confidence * 100, 1),
-                "reasoning": ma_result_forced.verdict_reasoning,
-                "mutation_types": ma_result_forced.prosecutor_response.mutation_types,
-                "process_time": "~30s",
-                "llm_calls": len(ma_result_forced.debate_transcript),
-                "forced_binary_used": ma_result_forced.forced_binary_used,
-                "initial_verdict": ma_result_forced.initial_verdict.value if ma_result_forced.initial_verdict else None,
-            },
-            "comparison": {
-                "sa_vs_ma_standard": sa_result.verdict.value == ma_result_standard.final_verdict.value,
-                "sa_vs_ma_forced": sa_result.verdict.value == ma_result_forced.final_verdict.value,
-                "ma_standard_vs_forced": ma_result_standard.final_verdict.value == ma_result_forced.final_verdict.value,
-                "forced_changed_verdict": ma_result_forced.forced_binary_used and (ma_result_forced.initial_verdict.value != ma_result_forced.final_verdict.value)
-            }
-        }
+            ),
+            multi_agent_forced=MultiAgentForcedRecord(
+                verdict=ma_f_v,
+                confidence=_pct(ma_result_forced.confidence),
+                reasoning=ma_result_forced.verdict_reasoning,
+                mutation_types=ma_result_forced.prosecutor_response.mutation_types,
+                process_time="~30s",
+                llm_calls=len(ma_result_forced.debate_transcript),
+                forced_binary_used=forced_used,
+                initial_verdict=init_v
+            ),
+            comparison=ComparisonRecord(
+                sa_vs_ma_standard=sa_v == ma_s_v,
+                sa_vs_ma_forced=sa_v == ma_f_v,
+                ma_standard_vs_forced=ma_s_v == ma_f_v,
+                forced_changed_verdict=forced_used and (init_v != ma_f_v)
+            )
+        )
+        
+        # Emit the case summary as one write so concurrent cases don't interleave
+        # (tqdm.write keeps it above the progress bar)
+        buf = io.StringIO()
+        buf.write(f"Case {idx}: {case['claim'][:60]}...\n")
+        buf.write(f"  ✓ Single-Agent:          {sa_v.upper()} ({sa_result.confidence:.0%})\n")
+        buf.write(f"  ✓ Multi-Agent (Standard): {ma_s_v.upper()} ({ma_result_standard.confidence:.0%})\n")
+        buf.write(f"  ✓ Multi-Agent (Forced):   {ma_f_v.upper()} ({ma_result_forced.confidence:.0%})\n")
+        if forced_used:
+            buf.write(f"    → Forced from: {init_v.upper()}\n")
+        tqdm.write(buf.getvalue(), end="")
         
-        comparison_data["cases"].append(case_data)
+        partial_f.write(orjson.dumps(case_data) + b"\n")
+        partial_f.flush()
+        os.fsync(partial_f.fileno())
         
-        print(f"  ✓ Single-Agent:          {sa_result.verdict.value.upper()} ({sa_result.confidence:.0%})")
-        print(f"  ✓ Multi-Agent (Standard): {ma_result_standard.final_verdict.value.upper()} ({ma_result_standard.confidence:.0%})")
-        print(f"  ✓ Multi-Agent (Forced):   {ma_result_forced.final_verdict.value.upper()} ({ma_result_forced.confidence:.0%})")
-        if ma_result_forced.forced_binary_used:
-            print(f"    → Forced from: {ma_result_forced.initial_verdict.value.upper()}")
+        return case_data
     
-    # Calculate overall statistics
+    # Cases are independent; case_slots bounds how many run at once and, being
+    # FIFO, lets them start in order.
+    print(f"🚀 Running {len(pending)} cases (up to {MAX_CONCURRENT_CASES} at a time)...")
+    # A failing case must not stop the others: every case runs to completion
+    # (and is persisted) before the file and HTTP client are closed
+    try:
+        with open(partial_path, 'ab') as partial_f:
+            results = await tqdm_asyncio.gather(
+                *(process_case(idx, case) for idx, case in pending), desc="cases", total=len(pending),
+                return_exceptions=True
+            )
+    finally:
+        http_client.close()
+    new_cases = [r for r in results if isinstance(r, CaseRecord)]
+    failures = [(idx, r) for (idx, _), r in zip(pending, results) if isinstance(r, BaseException)]
+    if failures:
+        print(f"\n❌ {len(failures)} of {len(pending)} cases failed; {len(new_cases)} new cases saved to {partial_path}")
+        for idx, exc in failures:
+            print(f"  Case {idx}: {exc!r}")
+        print("Rerun the same command to retry only the missing cases.")
+        raise failures[0][1]
+    comparison_data["cases"] = sorted([*done.values(), *new_cases], key=lambda c: c.case_id)
+    
+    # Calculate overall statistics in a single pass over the cases
     total_cases = len(comparison_data["cases"])
-    avg_sa_conf = sum(c["single_agent"]["confidence"] for c in comparison_data["cases"]) / total_cases
-    avg_ma_standard_conf = sum(c["multi_agent_standard"]["confidence"] for c in comparison_data["cases"]) / total_cases
-    avg_ma_forced_conf = sum(c["multi_agent_forced"]["confidence"] for c in comparison_data["cases"]) / total_cases
+    sa_conf_sum = ma_standard_conf_sum = ma_forced_conf_sum = 0.0
+    sa_counts, ma_standard_counts, ma_forced_counts = Counter(), Counter(), Counter()
+    total_forced = verdict_changed_by_forcing = 0
+    for c in comparison_data["cases"]:
+        sa, ma_standard, ma_forced = c.single_agent, c.multi_agent_standard, c.multi_agent_forced
+        sa_conf_sum += sa.confidence
+        ma_standard_conf_sum += ma_standard.confidence
+        ma_forced_conf_sum += ma_forced.confidence
+        sa_counts[sa.verdict] += 1
+        ma_standard_counts[ma_standard.verdict] += 1
+        ma_forced_counts[ma_forced.verdict] += 1
+        if ma_forced.forced_binary_used:
+            total_forced += 1
+        if c.comparison.forced_changed_verdict:
+            verdict_changed_by_forcing += 1
+    
+    avg_sa_conf = sa_conf_sum / total_cases
+    avg_ma_standard_conf = ma_standard_conf_sum / total_cases
+    avg_ma_forced_conf = ma_forced_conf_sum / total_cases
     
     comparison_data["statistics"] = {
         "average_confidence": {
@@ -169,53 +434,50 @@ def export_for_visualization(num_cases: int = 5):
             "multi_agent_forced": round(avg_ma_forced_conf, 1)
         },
         "verdict_distribution": {
-            "single_agent": {
-                "faithful": sum(1 for c in comparison_data["cases"] if c["single_agent"]["verdict"] == "faithful"),
-                "mutated": sum(1 for c in comparison_data["cases"] if c["single_agent"]["verdict"] == "mutated"),
-                "ambiguous": sum(1 for c in comparison_data["cases"] if c["single_agent"]["verdict"] == "ambiguous")
-            },
-            "multi_agent_standard": {
-                "faithful": sum(1 for c in comparison_data["cases"] if c["multi_agent_standard"]["verdict"] == "faithful"),
-                "mutated": sum(1 for c in comparison_data["cases"] if c["multi_agent_standard"]["verdict"] == "mutated"),
-                "ambiguous": sum(1 for c in comparison_data["cases"] if c["multi_agent_standard"]["verdict"] == "ambiguous")
-            },
-            "multi_agent_forced": {
-                "faithful": sum(1 for c in comparison_data["cases"] if c["multi_agent_forced"]["verdict"] == "faithful"),
-                "mutated": sum(1 for c in comparison_data["cases"] if c["multi_agent_forced"]["verdict"] == "mutated"),
-                "ambiguous": sum(1 for c in comparison_data["cases"] if c["multi_agent_forced"]["verdict"] == "ambiguous")
-            }
+            "single_agent": {v: sa_counts[v] for v in VERDICTS},
+            "multi_agent_standard": {v: ma_standard_counts[v] for v in VERDICTS},
+            "multi_agent_forced": {v: ma_forced_counts[v] for v in VERDICTS}
         },
         "forced_binary_stats": {
-            "total_forced": sum(1 for c in comparison_data["cases"] if c["multi_agent_forced"]["forced_binary_used"]),
-            "verdict_changed_by_forcing": sum(1 for c in comparison_data["cases"] if c["comparison"]["forced_changed_verdict"])
+            "total_forced": total_forced,
+            "verdict_changed_by_forcing": verdict_changed_by_forcing
         }
     }
     
-    # Export
-    output_file = "visualization_data.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(comparison_data, f, indent=2, ensure_ascii=False)
+    # Export (orjson serializes the dataclass records natively). Write to a
+    # temp file and swap it in, then drop the partial file once it's safe.
+    tmp_file = f"{output_file}.tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(orjson.dumps(comparison_data, option=orjson.OPT_INDENT_2))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, output_file)
+    partial_path.unlink(missing_ok=True)
     
-    print(f"\n{'='*70}")
+    print(f"\n{BAR}")
     print(f"✅ Comparison data exported to {output_file}")
-    print(f"{'='*70}")
+    print(BAR)
     print(f"\nStatistics:")
     print(f"  Total cases: {total_cases}")
     print(f"  Avg confidence (Single-Agent):     {avg_sa_conf:.1f}%")
     print(f"  Avg confidence (MA Standard):      {avg_ma_standard_conf:.1f}%")
     print(f"  Avg confidence (MA Forced Binary): {avg_ma_forced_conf:.1f}%")
     print(f"\nForced Binary Stats:")
-    print(f"  Cases forced to binary: {comparison_data['statistics']['forced_binary_stats']['total_forced']}/{total_cases}")
-    print(f"  Verdicts changed by forcing: {comparison_data['statistics']['forced_binary_stats']['verdict_changed_by_forcing']}")
+    print(f"  Cases forced to binary: {total_forced}/{total_cases}")
+    print(f"  Verdicts changed by forcing: {verdict_changed_by_forcing}")
     
     
     return output_file
 
 
 if __name__ == "__main__":
-    import sys
+    parser = argparse.ArgumentParser(description="Export three-way comparison data for visualization")
+    parser.add_argument("num_cases", type=int, nargs="?", default=5, help="Number of cases to run")
+    parser.add_argument("--batch", action="store_true",
+                        help="Run the single-agent pass through the OpenAI Batch API (cheaper, up to 24h)")
+    args = parser.parse_args()
     
-    num_cases = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    num_cases = args.num_cases
     print(f"🎯 Generating comparison data for {num_cases} cases\n")
     
-    export_for_visualization(num_cases)
+    asyncio.run(export_for_visualization(num_cases, batch=args.batch))
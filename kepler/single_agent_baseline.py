@@ -3,11 +3,14 @@ Single-Agent Baseline for Claim Verification
 Simple, direct approach without debate - for comparison with multi-agent system
 """
 
+import httpx
 from openai import OpenAI
 import json
 import os
+import time
 from dataclasses import dataclass
 from enum import Enum
+from typing import Optional
 
 
 class Verdict(Enum):
@@ -47,13 +50,12 @@ Be decisive and provide a clear verdict."""
 
 
 class SingleAgentVerifier:
-    def __init__(self, api_key: str, dev_mode: bool = True):
-        self.client = OpenAI(api_key=api_key)
+    def __init__(self, api_key: str, dev_mode: bool = True, http_client: Optional[httpx.Client] = None):
+        self.client = OpenAI(api_key=api_key, http_client=http_client)
         self.model = "gpt-4.1-mini" if dev_mode else "gpt-4.1"
     
-    def verify_claim(self, claim: str, truth: str) -> SingleAgentResult:
-        """Verify a claim against source truth using single-agent approach."""
-        
+    def _build_messages(self, claim: str, truth: str) -> list[dict]:
+        """Build the chat messages for verifying one claim-truth pair."""
         prompt = f"""Analyze this claim-fact pair:
 
 ORIGINAL FACT (Source of Truth):
@@ -64,19 +66,13 @@ EXTERNAL CLAIM (To Verify):
 
 Determine if the claim faithfully represents the fact, is mutated/distorted, or is ambiguous."""
 
-        messages = [
+        return [
             {"role": "system", "content": SINGLE_AGENT_SYSTEM},
             {"role": "user", "content": prompt}
         ]
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            temperature=0.7,
-            response_format={"type": "json_object"}
-        )
-
-        content = response.choices[0].message.content
+    def _parse_result(self, claim: str, truth: str, content: str) -> SingleAgentResult:
+        """Parse the model's JSON reply into a SingleAgentResult."""
         result = json.loads(content)
         
         # Parse verdict
@@ -98,6 +94,72 @@ Determine if the claim faithfully represents the fact, is mutated/distorted, or
             raw_response=result
         )
 
+    def verify_claim(self, claim: str, truth: str) -> SingleAgentResult:
+        """Verify a claim against source truth using single-agent approach."""
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(claim, truth),
+            temperature=0.7,
+            response_format={"type": "json_object"}
+        )
+
+        return self._parse_result(claim, truth, response.choices[0].message.content)
+
+    def verify_claims_batch(self, cases: list[dict], poll_interval: float = 30.0) -> list[SingleAgentResult]:
+        """Verify many claims through the OpenAI Batch API.
+
+        Batched requests cost 50% less but may take up to 24h to complete, so
+        this suits large offline runs. Blocks until the batch finishes; any
+        request missing from the batch output is retried with verify_claim.
+        """
+        lines = []
+        for idx, case in enumerate(cases):
+            lines.append(json.dumps({
+                "custom_id": str(idx),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": self._build_messages(case['claim'], case['truth']),
+                    "temperature": 0.7,
+                    "response_format": {"type": "json_object"}
+                }
+            }))
+
+        batch_file = self.client.files.create(
+            file=("single_agent_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"📦 Submitted batch {batch.id} with {len(cases)} requests")
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        contents = {}
+        if batch.output_file_id:
+            for line in self.client.files.content(batch.output_file_id).text.splitlines():
+                if not line:
+                    continue
+                entry = json.loads(line)
+                response = entry.get("response") or {}
+                if response.get("status_code") == 200:
+                    contents[int(entry["custom_id"])] = response["body"]["choices"][0]["message"]["content"]
+
+        if len(contents) < len(cases):
+            print(f"⚠️  Batch {batch.id} {batch.status}: {len(cases) - len(contents)} requests missing, retrying directly")
+
+        return [
+            self._parse_result(case['claim'], case['truth'], contents[idx]) if idx in contents
+            else self.verify_claim(case['claim'], case['truth'])
+            for idx, case in enumerate(cases)
+        ]
+
 
 def run_single_agent_baseline(cases: list[dict], api_key: str) -> list[SingleAgentResult]:
     """Run single-agent verification on all cases."""